@@ -1,10 +1,26 @@
 import os
+import signal
+import sys
+import time
+import traceback
+from datetime import datetime, timedelta, timezone
+import json
+import blake3
+from html import escape
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_CA_BUNDLE_PATH
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
+from lxml import etree
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import Dict, List, Optional
+import threading
+import multiprocessing as mp
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+import email.policy
+from email.message import EmailMessage
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 
 # -------------------------------------------------------
@@ -13,6 +29,14 @@ from typing import Dict, List, Optional
 
 URL_TO_SCRAPE = "https://ipocentral.in/ipo-discussion/"
 
+# More pages with the same GMP table layout can be added (comma
+# separated); they are fetched concurrently and merged into one email
+URLS_TO_SCRAPE = [
+    u.strip()
+    for u in (os.getenv("URLS_TO_SCRAPE") or URL_TO_SCRAPE).split(",")
+    if u.strip()
+]
+
 # Will use env vars if present (for GitHub Actions),
 # otherwise ask interactively (for local testing)
 SENDER_EMAIL = (os.getenv("SENDER_EMAIL") or input("Sender email: ")).strip()
@@ -27,104 +51,461 @@ RECIPIENT_EMAILS = [r.strip() for r in raw_receivers.split(",") if r.strip()]
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 
+# Gmail throttles connections that pile up too many RCPT TOs, so long
+# recipient lists are sent as several envelopes of at most this size
+RECIPIENTS_PER_ENVELOPE = 50
+
+# Remembers what the last emailed pages looked like, so unchanged days
+# can be skipped (persisted between GitHub Actions runs via actions/cache)
+STATE_DIR = os.path.expanduser("~/.cache/ipo_gmp")
+STATE_FILE = os.path.join(STATE_DIR, "state.json")
+
+# With --daemon the script stays resident and scrapes at these times of
+# day (UTC, comma separated); the default matches the GitHub Actions cron
+RUN_TIMES_UTC = [
+    t.strip()
+    for t in (os.getenv("RUN_TIMES_UTC") or "04:30").split(",")
+    if t.strip()
+]
+
 
 # -------------------------------------------------------
 # GMP TABLE PARSER
 # -------------------------------------------------------
 
-def parse_gmp_rows(rows) -> Dict[str, List[dict]]:
+# Compiled once; evaluated in C for every row instead of find_all().
+# Only the cells the fixed 5-column layout uses are selected, so the
+# result lists stay minimal and wider rows aren't walked to the end.
+ROW_HEADERS = etree.XPath("th[1]")
+ROW_CELLS = etree.XPath("td[position() <= 5]")
+
+
+def cell_text(cell) -> str:
+    """Text of a cell with every string stripped, like get_text(strip=True)."""
+    return "".join(s.strip() for s in cell.itertext())
+
+
+def declared_charset(response) -> Optional[str]:
+    """
+    Charset from the Content-Type header, or None to let lxml pick it
+    up from the page's <meta charset>.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "charset":
+            return value.strip("'\" ") or None
+    return None
+
+
+def iter_table_rows(chunks: Iterable[bytes], charset: Optional[str]) -> Iterator:
+    """
+    Feed the page to lxml as it downloads and yield every <tr> as soon
+    as it is complete. Each row is cleared (and earlier ones dropped)
+    once the caller moves on, so memory stays flat whatever the page size.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="tr", encoding=charset)
+
+    def completed_rows():
+        for _, row in parser.read_events():
+            yield row
+            row.clear(keep_tail=True)
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from completed_rows()
+
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        return  # empty page, nothing to parse
+    yield from completed_rows()
+
+
+class IpoRow(NamedTuple):
+    """One IPO from the GMP table (a tuple, so no per-row dict)."""
+    section: str
+    name: str
+    window: str
+    price: str
+    gmp: str
+    gmp_percent: str
+    subject_to: str
+
+
+def parse_gmp_rows(rows) -> Dict[str, List[IpoRow]]:
     """
     Parse a sequence of <tr> elements like the one you pasted into:
     {
-      "Mainboard IPO": [ {row}, ... ],
-      "SME IPO": [ {row}, ... ]
+      "Mainboard IPO": [ IpoRow(...), ... ],
+      "SME IPO": [ IpoRow(...), ... ]
     }
     """
-    sections: Dict[str, List[dict]] = {}
+    sections: Dict[str, List[IpoRow]] = {}
     current_section: Optional[str] = None
 
     for row in rows:
         # Header row (Mainboard IPO / SME IPO)
-        th_cells = row.find_all("th")
+        th_cells = ROW_HEADERS(row)
         if th_cells:
-            header_text = th_cells[0].get_text(strip=True)
+            header_text = cell_text(th_cells[0])
             if header_text:  # e.g. "Mainboard IPO" or "SME IPO"
                 current_section = header_text
                 sections.setdefault(current_section, [])
             continue
 
         # Data row
-        td_cells = row.find_all("td")
+        td_cells = ROW_CELLS(row)
         if not td_cells or current_section is None:
             continue
 
         # Column 1: IPO name + bidding window in brackets
         first_td = td_cells[0]
         # Example: "ICICI Prudential AMC\n(12 - 16 Dec)"
-        parts = list(first_td.stripped_strings)
+        parts = [s for s in map(str.strip, first_td.itertext()) if s]
         name = parts[0] if parts else ""
         window = parts[1] if len(parts) > 1 else ""
 
-        price = td_cells[1].get_text(strip=True)       # Price*
-        gmp = td_cells[2].get_text(strip=True)         # IPO GMP
-        gmp_pct = td_cells[3].get_text(strip=True)     # GMP %
-        subject_to = td_cells[4].get_text(strip=True)  # Subject to
-
-        row_data = {
-            "section": current_section,
-            "name": name,
-            "window": window,
-            "price": price,
-            "gmp": gmp,
-            "gmp_percent": gmp_pct,
-            "subject_to": subject_to,
-        }
+        price = cell_text(td_cells[1])       # Price*
+        gmp = cell_text(td_cells[2])         # IPO GMP
+        gmp_pct = cell_text(td_cells[3])     # GMP %
+        subject_to = cell_text(td_cells[4])  # Subject to
 
-        sections[current_section].append(row_data)
+        sections[current_section].append(
+            IpoRow(current_section, name, window, price, gmp, gmp_pct, subject_to)
+        )
 
     return sections
 
 
+# -------------------------------------------------------
+# STATE
+# -------------------------------------------------------
+
+def load_state() -> dict:
+    """
+    Load the per-URL ETag / Last-Modified validators, content hashes and
+    parsed sections saved by the previous run. A missing or corrupt file
+    just means "no state".
+    """
+    try:
+        with open(STATE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state: dict):
+    os.makedirs(STATE_DIR, exist_ok=True)
+    with open(STATE_FILE, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
 # -------------------------------------------------------
 # SCRAPER
 # -------------------------------------------------------
 
-def scrape_site() -> str:
-    session = requests.Session()
-
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/129.0 Safari/537.36"
-        ),
-        "Accept": (
-            "text/html,application/xhtml+xml,application/xml;q=0.9,"
-            "image/avif,image/webp,*/*;q=0.8"
-        ),
-        "Accept-Language": "en-US,en;q=0.9",
-        "Referer": "https://ipocentral.in/",
-        "Connection": "keep-alive",
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/129.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/avif,image/webp,*/*;q=0.8"
+    ),
+    # Brotli bodies are smaller than gzip; urllib3 decodes them via the
+    # Brotli package in requirements.txt
+    "Accept-Encoding": "gzip, br",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Referer": "https://ipocentral.in/",
+    "Connection": "keep-alive",
+}
+
+
+class SharedTLSAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose HTTPS connections all use one SSLContext with the
+    CA bundle loaded once. By default urllib3 builds a fresh context and
+    re-reads certifi's bundle for every new connection. Certificate and
+    hostname verification are unchanged.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._ssl_context = create_urllib3_context()
+        self._ssl_context.load_verify_locations(DEFAULT_CA_BUNDLE_PATH)
+        super().__init__(*args, **kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        # Only the default "verify against certifi" case is shared
+        if host_params["scheme"] == "https" and verify is True and cert is None:
+            pool_kwargs["ssl_context"] = self._ssl_context
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if verify is True and cert is None and url.lower().startswith("https"):
+            conn.ca_certs = None  # already loaded into the shared context
+
+
+# Shared by every scrape in this process, so repeat GETs reuse a pooled
+# keep-alive connection instead of paying for a new TCP + TLS handshake
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    "https://",
+    SharedTLSAdapter(
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+
+
+# Bytes handed to the parser per read while streaming a page
+CHUNK_SIZE = 8192
+
+# Limits for the child process that parses each page: how much CPU time
+# it may spend (and how long to wait for its result once the whole page
+# was sent), and how much address space it may add on top of what it
+# inherits from the scraper
+PARSE_TIMEOUT = 30
+PARSE_MEMORY_LIMIT = 512 << 20
+
+
+class ParseProcess:
+    """
+    Forked child that parses one page fed to it chunk by chunk. A
+    pathological page can then only exhaust the child's time or memory,
+    not the scraper's. Linux only (fork + /proc); create these before
+    starting any threads.
+    """
+
+    def __init__(self):
+        ctx = mp.get_context("fork")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(target=self._run, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    @staticmethod
+    def _run(conn):
+        import resource  # POSIX only
+
+        with open("/proc/self/statm") as f:
+            inherited = int(f.read().split()[0]) * resource.getpagesize()
+        limit = inherited + PARSE_MEMORY_LIMIT
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        # CPU time rather than wall-clock time, so a slow download doesn't
+        # count against the parser. Going over it kills the child with
+        # SIGXCPU, which shouldn't leave a core dump behind.
+        resource.setrlimit(resource.RLIMIT_CPU, (PARSE_TIMEOUT, PARSE_TIMEOUT + 5))
+        resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+        charset = conn.recv()
+
+        def chunks():
+            while True:
+                chunk = conn.recv_bytes()
+                if not chunk:
+                    return
+                yield chunk
+
+        received = chunks()
+        try:
+            result = parse_gmp_rows(iter_table_rows(received, charset))
+        except Exception:
+            # Read the rest of the page so the parent isn't left writing
+            # into a closed pipe, then hand it the error. It goes as text
+            # since not every exception pickles (lxml's parse errors don't).
+            for _ in received:
+                pass
+            result = traceback.format_exc()
+        conn.send(result)
+
+    def parse(self, chunks: Iterable[bytes], charset: Optional[str]) -> Dict[str, List[IpoRow]]:
+        try:
+            self._conn.send(charset)
+            for chunk in chunks:
+                self._conn.send_bytes(chunk)
+            self._conn.send_bytes(b"")
+
+            if not self._conn.poll(PARSE_TIMEOUT):
+                raise TimeoutError(f"Parsing the page took over {PARSE_TIMEOUT}s")
+            result = self._conn.recv()
+        except (EOFError, BrokenPipeError, ConnectionResetError):
+            self._process.join(PARSE_TIMEOUT)
+            if self._process.exitcode == -signal.SIGXCPU:
+                raise TimeoutError(
+                    f"Parsing the page took over {PARSE_TIMEOUT}s of CPU time"
+                ) from None
+            raise RuntimeError("Parser process died (out of memory?)") from None
+
+        if isinstance(result, str):
+            raise RuntimeError(f"Parsing the page failed in the parser process:\n{result}")
+        return result
+
+    def close(self):
+        # The child is done (or unused, e.g. on a 304), so don't wait on it
+        self._conn.close()
+        self._process.terminate()
+        self._process.join()
+
+
+def fetch_page(url: str, entry: dict) -> requests.Response:
+    """
+    Start a streamed GET for one page. When `entry` (that page's slot in
+    the run state) holds the sections parsed last time, the request
+    carries its validators so the server can answer 304 instead.
+    """
+    headers = {}
+    if "sections" in entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    return SESSION.get(url, headers=headers, timeout=20, stream=True)
+
+
+def scrape_page(
+    url: str,
+    entry: dict,
+    parser: Optional[ParseProcess] = None,
+    on_fresh_page: Optional[Callable[[], None]] = None,
+) -> Tuple[bool, Dict[str, List[IpoRow]]]:
+    """
+    Download and parse one page in a single pass.
+
+    Returns (changed, sections) where `changed` says whether the body
+    differs from the last run. On 304 Not Modified the sections cached
+    in `entry` are returned without downloading or parsing anything;
+    otherwise `entry` is updated with the new validators, content hash
+    and sections. HTTP errors (including 403) are raised.
+    The page is parsed in `parser` when given, otherwise in-process.
+    `on_fresh_page` is called as soon as the server answers with a
+    body, before it is downloaded.
+    """
+    with fetch_page(url, entry) as response:
+        if response.status_code == 304:
+            return False, {
+                section_name: [IpoRow(**row) for row in rows]
+                for section_name, rows in entry["sections"].items()
+            }
+
+        response.raise_for_status()
+
+        if on_fresh_page is not None:
+            on_fresh_page()
+
+        # Not every server sends validators, so also hash the body itself
+        # (BLAKE3: SIMD-accelerated, so hashing is noise next to parsing)
+        hasher = blake3.blake3()
+
+        def chunks():
+            for chunk in response.iter_content(CHUNK_SIZE):
+                hasher.update(chunk)
+                yield chunk
+
+        charset = declared_charset(response)
+        if parser is not None:
+            sections = parser.parse(chunks(), charset)
+        else:
+            sections = parse_gmp_rows(iter_table_rows(chunks(), charset))
+
+    digest = hasher.hexdigest()
+    changed = digest != entry.get("blake3")
+
+    entry["etag"] = response.headers.get("ETag")
+    entry["last_modified"] = response.headers.get("Last-Modified")
+    entry["blake3"] = digest
+    # Saved as dicts so the JSON stays readable whatever the field order
+    entry["sections"] = {
+        section_name: [row._asdict() for row in rows]
+        for section_name, rows in sections.items()
     }
 
-    response = session.get(URL_TO_SCRAPE, headers=headers, timeout=20)
+    return changed, sections
+
+
+# Email body templates, built once instead of per section / per row.
+# No indentation inside them: every byte is repeated per section / row
+# and then goes through quoted-printable encoding and SMTP DATA.
+TABLE_HEADER = (
+    '<table border="1" cellpadding="6" cellspacing="0" style="border-collapse:'
+    ' collapse; font-family: Arial, sans-serif; font-size: 14px;">'
+    '<tr style="background-color:#f2f2f2; font-weight:bold;">'
+    "<th>IPO Name</th><th>Bidding Window</th><th>Price</th><th>GMP</th>"
+    "<th>GMP %</th><th>Subject To</th></tr>"
+)
+
+ROW_TMPL = (
+    "<tr><td>{row.name}</td><td>{row.window}</td><td>{row.price}</td>"
+    "<td>{row.gmp}</td><td>{row.gmp_percent}</td><td>{row.subject_to}</td></tr>"
+)
 
-    if response.status_code == 403:
+
+def scrape_site(
+    state: dict, on_fresh_page: Optional[Callable[[], None]] = None
+) -> Optional[str]:
+    """
+    Scrape every page in URLS_TO_SCRAPE and build the email body.
+
+    Returns None when no page changed since the run that saved `state`.
+    Once every page was scraped, `state` is updated in place with the new
+    validators, content hashes and parsed sections; the caller decides
+    when to persist it. If the site blocks the run, `state` is left as it
+    was so the changes are still picked up next time. `on_fresh_page` is
+    passed on to scrape_page() (it may be called from several threads).
+    """
+    # Pages are scraped into copies of their entries, merged back below
+    entries = [dict(state.get(url, {})) for url in URLS_TO_SCRAPE]
+
+    # Parser processes are forked up front, while this is still the only
+    # thread (forking next to running threads can deadlock the child).
+    # Elsewhere than Linux pages are simply parsed in-process.
+    if sys.platform == "linux":
+        parsers = [ParseProcess() for _ in URLS_TO_SCRAPE]
+    else:
+        parsers = [None] * len(URLS_TO_SCRAPE)
+
+    # All pages are requested at once, so the wait is the slowest
+    # server's round trips rather than the sum over every page
+    try:
+        with ThreadPoolExecutor(max_workers=len(URLS_TO_SCRAPE)) as pool:
+            scrape = partial(scrape_page, on_fresh_page=on_fresh_page)
+            results = list(pool.map(scrape, URLS_TO_SCRAPE, entries, parsers))
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 403:
+            raise
         print("Got 403 Forbidden from the server.")
         return (
             "<p>Scraping blocked by the website (HTTP 403 Forbidden). "
             "They may be blocking bots / scripts.</p>"
         )
+    finally:
+        for parser in parsers:
+            if parser is not None:
+                parser.close()
 
-    response.raise_for_status()
+    # Record the completed run, dropping pages that are no longer configured
+    state.clear()
+    state.update(zip(URLS_TO_SCRAPE, entries))
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    if not any(changed for changed, _ in results):
+        return None
 
-    # Grab ALL table rows on the page from any table
-    rows = soup.select("table tr")
-
-    # Parse into structured sections
-    sections = parse_gmp_rows(rows)
+    # Merge the structured sections across pages
+    sections: Dict[str, List[IpoRow]] = {}
+    for _, page_sections in results:
+        for section_name, ipos in page_sections.items():
+            sections.setdefault(section_name, []).extend(ipos)
 
     if not sections:
         return "<p>No GMP table data could be parsed from the page.</p>"
@@ -138,38 +519,19 @@ def scrape_site() -> str:
     # )
 
     for section_name, ipos in sections.items():
-        html.append(f"<h3>{section_name}</h3>")
+        html.append(f"<h3>{escape(section_name)}</h3>")
 
         if not ipos:
             html.append("<p>No rows</p>")
             continue
 
-        # Table header
-        html.append("""
-        <table border="1" cellpadding="6" cellspacing="0"
-               style="border-collapse: collapse; font-family: Arial, sans-serif; font-size: 14px;">
-            <tr style="background-color:#f2f2f2; font-weight:bold;">
-                <th>IPO Name</th>
-                <th>Bidding Window</th>
-                <th>Price</th>
-                <th>GMP</th>
-                <th>GMP %</th>
-                <th>Subject To</th>
-            </tr>
-        """)
-
-        # Table rows
-        for ipo in ipos:
-            html.append(f"""
-            <tr>
-                <td>{ipo['name']}</td>
-                <td>{ipo['window']}</td>
-                <td>{ipo['price']}</td>
-                <td>{ipo['gmp']}</td>
-                <td>{ipo['gmp_percent']}</td>
-                <td>{ipo['subject_to']}</td>
-            </tr>
-            """)
+        html.append(TABLE_HEADER)
+
+        # Table rows (scraped text is escaped so it can't inject markup)
+        html.extend(
+            ROW_TMPL.format(row=IpoRow._make(map(escape, ipo)))
+            for ipo in ipos
+        )
 
         html.append("</table><br/>")
 
@@ -182,23 +544,138 @@ def scrape_site() -> str:
 # EMAIL SENDER
 # -------------------------------------------------------
 
-def send_email(subject: str, body_html: str):
-    msg = MIMEMultipart("alternative")
+def sendmail_pipelined(
+    server: smtplib.SMTP, from_addr: str, to_addrs: List[str], msg: bytes
+) -> Dict[str, Tuple[int, bytes]]:
+    """
+    Same contract as server.sendmail(), but when the server advertises
+    PIPELINING (RFC 2920) MAIL FROM and every RCPT TO are written in one
+    go and the replies read afterwards. smtplib waits for each reply, so
+    N recipients would otherwise cost N + 1 round trips instead of one.
+    """
+    server.ehlo_or_helo_if_needed()
+    if not server.has_extn("pipelining"):
+        return server.sendmail(from_addr, to_addrs, msg)
+
+    def abort(code: int):
+        # As in smtplib: 421 means the server is closing the connection,
+        # anything else just needs the transaction reset
+        if code == 421:
+            server.close()
+        else:
+            try:
+                server.rset()
+            except smtplib.SMTPServerDisconnected:
+                pass
+
+    commands = [f"MAIL FROM:{smtplib.quoteaddr(from_addr)}"]
+    commands += [f"RCPT TO:{smtplib.quoteaddr(addr)}" for addr in to_addrs]
+    server.send("".join(f"{command}\r\n" for command in commands))
+
+    # Every reply has to be read, even after a failure, to stay in sync,
+    # unless the server said it's hanging up (e.g. Gmail's "too many")
+    replies = []
+    for _ in commands:
+        replies.append(server.getreply())
+        if replies[-1][0] == 421:
+            break
+
+    code, resp = replies[0]
+    if code != 250:
+        abort(code)
+        raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+
+    refused = {
+        addr: reply
+        for addr, reply in zip(to_addrs, replies[1:])
+        if reply[0] not in (250, 251)
+    }
+    if replies[-1][0] == 421 or len(refused) == len(to_addrs):
+        abort(replies[-1][0])
+        raise smtplib.SMTPRecipientsRefused(refused)
+
+    code, resp = server.data(msg)
+    if code != 250:
+        abort(code)
+        raise smtplib.SMTPDataError(code, resp)
+
+    return refused
+
+
+class SmtpSession:
+    """
+    One SMTP connection (connect, STARTTLS, login) reused for every
+    message sent inside the block:
+
+        with SmtpSession() as smtp:
+            send_email(smtp.server, ...)
+            send_email(smtp.server, ...)
+
+    The handshake happens on first use of `server`, or earlier on a
+    worker thread via connect_in_background() so that its round trips
+    overlap other I/O such as downloading the GMP pages.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connecting: Optional[Future] = None
+
+    def __enter__(self) -> "SmtpSession":
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        return self
+
+    def connect_in_background(self):
+        """Start the handshake unless it is already running or done."""
+        with self._lock:
+            if self._connecting is None:
+                self._connecting = self._executor.submit(self._connect)
+
+    @property
+    def server(self) -> smtplib.SMTP:
+        """The logged-in connection, waiting for the handshake if needed."""
+        self.connect_in_background()
+        return self._connecting.result()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+        try:
+            server.starttls()
+            server.ehlo()  # extensions (incl. PIPELINING) as offered over TLS
+            server.login(SENDER_EMAIL, SENDER_PASSWORD)
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def __exit__(self, *exc_info):
+        self._executor.shutdown()  # lets a pending handshake finish
+        if self._connecting is not None and self._connecting.exception() is None:
+            # smtplib's own __exit__ sends QUIT and tolerates a dropped link
+            return self._connecting.result().__exit__(*exc_info)
+
+
+def send_email(server: smtplib.SMTP, subject: str, body_html: str):
+    msg = EmailMessage()
     msg["From"] = SENDER_EMAIL
-    msg["To"] = ", ".join(RECIPIENT_EMAILS)
+    # Recipients are only in the SMTP envelope, i.e. everyone is Bcc'd
+    # and nobody sees the rest of the list
+    msg["To"] = "undisclosed-recipients:;"
     msg["Subject"] = subject
 
     # Optional: plain-text fallback (very simple)
     plain_fallback = "Your email client does not support HTML. Please open in a modern email app."
-    msg.attach(MIMEText(plain_fallback, "plain"))
+    msg.set_content(plain_fallback)
 
-    # HTML part with table
-    msg.attach(MIMEText(body_html, "html"))
+    # HTML part with table (quoted-printable keeps the body 7-bit clean)
+    msg.add_alternative(body_html, subtype="html", cte="quoted-printable")
 
-    with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-        server.starttls()
-        server.login(SENDER_EMAIL, SENDER_PASSWORD)
-        server.sendmail(SENDER_EMAIL, RECIPIENT_EMAILS, msg.as_string())
+    # Recipients aren't in the headers, so every batch gets the same
+    # bytes and the (large) HTML body is only serialized once, straight
+    # to CRLF-terminated bytes
+    msg_bytes = msg.as_bytes(policy=email.policy.SMTP)
+    for i in range(0, len(RECIPIENT_EMAILS), RECIPIENTS_PER_ENVELOPE):
+        batch = RECIPIENT_EMAILS[i:i + RECIPIENTS_PER_ENVELOPE]
+        sendmail_pipelined(server, SENDER_EMAIL, batch, msg_bytes)
 
 
 # -------------------------------------------------------
@@ -206,15 +683,57 @@ def send_email(subject: str, body_html: str):
 # -------------------------------------------------------
 
 def main():
-    print("Scraping site...")
-    content_html = scrape_site()
-    print("Scrape OK, sending email...")
+    state = load_state()
 
-    send_email("Daily IPO GMP Summary", content_html)
+    with SmtpSession() as smtp:
+        print("Scraping site...")
+        # Log in to SMTP while the pages download, but only once one of
+        # them came back with a body (a 304 means there's nothing to send)
+        content_html = scrape_site(state, on_fresh_page=smtp.connect_in_background)
+
+        if content_html is None:
+            print("Page unchanged since the last email, skipping.")
+            save_state(state)
+            return
+
+        print("Scrape OK, sending email...")
+
+        send_email(smtp.server, "Daily IPO GMP Summary", content_html)
+    save_state(state)
     print("Email sent to:")
     for r in RECIPIENT_EMAILS:
         print(" -", r)
 
 
+def seconds_until_next_run(now: datetime) -> float:
+    """Seconds from `now` (UTC) to the next time in RUN_TIMES_UTC."""
+    upcoming = []
+    for run_time in RUN_TIMES_UTC:
+        hour, minute = map(int, run_time.split(":"))
+        run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if run_at <= now:
+            run_at += timedelta(days=1)
+        upcoming.append(run_at)
+    return (min(upcoming) - now).total_seconds()
+
+
+def run_daemon():
+    """
+    Run main() at every RUN_TIMES_UTC, forever. Unlike a cron job that
+    starts a fresh interpreter each time, the imports, lxml and SESSION's
+    keep-alive pool stay warm between runs. A failed run is logged and
+    the daemon carries on with the next one.
+    """
+    while True:
+        time.sleep(seconds_until_next_run(datetime.now(timezone.utc)))
+        try:
+            main()
+        except Exception:
+            traceback.print_exc()
+
+
 if __name__ == "__main__":
-    main()
+    if "--daemon" in sys.argv[1:]:
+        run_daemon()
+    else:
+        main()